@@ -0,0 +1,44 @@
+# cython: language_level=3
+"""Typed FIX field scanner used by bench_simplefix.py.
+
+Built on first import through pyximport, or ahead of time with
+``cythonize -i benchmarks/_fastscan.pyx``.
+"""
+
+cimport cython
+from cpython.bytes cimport PyBytes_FromStringAndSize
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def scan(const unsigned char[::1] buf, list out):
+    """Append a ``(tag, value)`` pair to ``out`` for every complete field in ``buf``.
+
+    Returns the number of fields appended.
+    """
+    cdef Py_ssize_t n = buf.shape[0]
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t start
+    cdef int tag
+    cdef int count = 0
+    cdef const unsigned char *p
+
+    if n == 0:
+        return 0
+    p = &buf[0]
+
+    while i < n:
+        tag = 0
+        while i < n and p[i] != 0x3D:
+            tag = tag * 10 + (p[i] - 48)
+            i += 1
+        i += 1
+        start = i
+        while i < n and p[i] != 0x01:
+            i += 1
+        if i >= n:
+            break
+        out.append((tag, PyBytes_FromStringAndSize(<const char *>p + start, i - start)))
+        count += 1
+        i += 1
+    return count
@@ -2,40 +2,41 @@
 """Cross-validation test between mojofix and simplefix.
 
 Compares encoding and parsing behavior to ensure 100% compatibility.
+
+The simplefix reference results are stored in golden_fix_vectors.json, so
+simplefix is only needed to regenerate them:
+
+    python test/test_cross_validation.py --regenerate
 """
 
+import json
 import subprocess
 import sys
 import tempfile
 import os
 
-try:
-    import simplefix
-except ImportError:
-    print("ERROR: simplefix not installed. Install with: pip install simplefix")
-    sys.exit(1)
 
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+GOLDEN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden_fix_vectors.json')
 
-def test_encoding_compatibility():
-    """Test that mojofix and simplefix produce compatible encodings."""
-    print("=" * 70)
-    print("CROSS-VALIDATION: Encoding Compatibility")
-    print("=" * 70)
+
+def generate_golden_vectors():
+    """Encode and parse the reference cases with simplefix and save the results."""
+    try:
+        import simplefix
+    except ImportError:
+        print("ERROR: simplefix not installed. Install with: pip install simplefix")
+        return 1
     
-    test_cases = [
+    encoding_cases = [
         ("FIX.4.2", "D", [("55", "AAPL"), ("54", "1"), ("38", "100")]),
         ("FIX.4.4", "A", [("98", "0"), ("108", "30")]),
         ("FIX.4.4", "0", []),  # Heartbeat
         ("FIX.4.2", "8", [("37", "ORDER123"), ("17", "EXEC456")]),
     ]
     
-    passed = 0
-    failed = 0
-    
-    for version, msg_type, fields in test_cases:
-        print(f"\nTest: {version} MsgType={msg_type}")
-        
-        # Create message with simplefix
+    encoding = []
+    for version, msg_type, fields in encoding_cases:
         simple_msg = simplefix.FixMessage()
         simple_msg.append_pair(8, version)
         simple_msg.append_pair(35, msg_type)
@@ -43,67 +44,143 @@ def test_encoding_compatibility():
             simple_msg.append_pair(int(tag), value)
         
         simple_encoded = simple_msg.encode().decode('utf-8')
+        simple_fields = parse_fix_fields(simple_encoded)
         
-        # Create Mojo test file
-        mojo_code = f'''
-from mojofix.message import FixMessage
+        # Only the critical fields are compared (not byte-for-byte as formatting may differ)
+        critical_tags = ['8', '35'] + [tag for tag, _ in fields]
+        encoding.append({
+            "begin_string": version,
+            "msg_type": msg_type,
+            "fields": fields,
+            "encoded": simple_encoded,
+            "expected_fields": {tag: simple_fields.get(tag) for tag in critical_tags},
+        })
+    
+    parsing_cases = [
+        ("Heartbeat", [(8, "FIX.4.2"), (35, "0")]),
+        ("New Order", [(8, "FIX.4.4"), (35, "D"), (55, "MSFT"), (54, "1"), (38, "200")]),
+        ("Logon", [(8, "FIX.4.2"), (35, "A"), (98, "0"), (108, "30")]),
+    ]
+    
+    parsing = []
+    for test_name, pairs in parsing_cases:
+        msg = simplefix.FixMessage()
+        for tag, value in pairs:
+            msg.append_pair(tag, value)
+        fix_message = msg.encode().decode('utf-8')
+        
+        simple_parser = simplefix.FixParser()
+        simple_parser.append_buffer(fix_message.encode('utf-8'))
+        simple_parsed = simple_parser.get_message()
+        
+        parsing.append({
+            "name": test_name,
+            "message": fix_message,
+            "expected_fields": {
+                tag: simple_parsed.get(int(tag)).decode('utf-8') if simple_parsed.get(int(tag)) else None
+                for tag in ('8', '35')
+            },
+        })
+    
+    with open(GOLDEN_FILE, 'w') as f:
+        json.dump({"encoding": encoding, "parsing": parsing}, f, indent=2)
+        f.write('\n')
+    
+    print(f"Wrote {len(encoding)} encoding and {len(parsing)} parsing vectors to {GOLDEN_FILE}")
+    return 0
 
-fn main() raises:
+
+def load_golden_vectors():
+    with open(GOLDEN_FILE) as f:
+        return json.load(f)
+
+
+def run_mojo(mojo_code):
+    """Run a generated Mojo program once and return the completed process."""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.mojo', delete=True) as f:
+        f.write(mojo_code)
+        f.flush()
+        return subprocess.run(
+            ['pixi', 'run', 'mojo', 'run', '-I', 'src', f.name],
+            capture_output=True,
+            text=True,
+            cwd=ROOT_DIR
+        )
+
+
+def split_cases(output):
+    """Group driver output lines of the form 'CASE <idx> <payload>' by index."""
+    cases = {}
+    for line in output.split('\n'):
+        if line.startswith('CASE '):
+            _, idx, payload = line.split(' ', 2)
+            cases.setdefault(int(idx), []).append(payload)
+    return cases
+
+
+def test_encoding_compatibility():
+    """Test that mojofix and simplefix produce compatible encodings."""
+    print("=" * 70)
+    print("CROSS-VALIDATION: Encoding Compatibility")
+    print("=" * 70)
+    
+    test_cases = load_golden_vectors()["encoding"]
+    
+    # Build every case into one Mojo driver so the toolchain starts only once
+    mojo_code = '''
+from mojofix.message import FixMessage
+'''
+    for idx, case in enumerate(test_cases):
+        mojo_code += f'''
+fn case_{idx}() raises -> String:
     var msg = FixMessage()
-    msg.append_pair(8, "{version}")
-    msg.append_pair(35, "{msg_type}")
+    msg.append_pair(8, "{case["begin_string"]}")
+    msg.append_pair(35, "{case["msg_type"]}")
 '''
-        for tag, value in fields:
+        for tag, value in case["fields"]:
             mojo_code += f'    msg.append_pair({tag}, "{value}")\n'
-        
-        mojo_code += '''    var encoded = msg.encode()
-    print(encoded, end="")
+        mojo_code += '    return msg.encode()\n'
+    
+    mojo_code += '''
+fn main() raises:
 '''
+    for idx in range(len(test_cases)):
+        mojo_code += f'    print("CASE {idx} " + case_{idx}())\n'
+    
+    result = run_mojo(mojo_code)
+    if result.returncode != 0:
+        print(f"  ❌ FAIL: Mojo execution failed")
+        print(f"  Error: {result.stderr}")
+    mojo_cases = split_cases(result.stdout)
+    
+    passed = 0
+    failed = 0
+    
+    for idx, case in enumerate(test_cases):
+        print(f"\nTest: {case['begin_string']} MsgType={case['msg_type']}")
         
-        # Write and run Mojo code
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.mojo', delete=False) as f:
-            f.write(mojo_code)
-            mojo_file = f.name
+        if idx not in mojo_cases:
+            print(f"  ❌ FAIL: No output from Mojo driver")
+            failed += 1
+            continue
         
-        try:
-            result = subprocess.run(
-                ['pixi', 'run', 'mojo', 'run', '-I', 'src', mojo_file],
-                capture_output=True,
-                text=True,
-                cwd=os.path.dirname(os.path.abspath(__file__)) + '/..'
-            )
-            
-            if result.returncode != 0:
-                print(f"  ❌ FAIL: Mojo execution failed")
-                print(f"  Error: {result.stderr}")
-                failed += 1
-                continue
-            
-            mojo_encoded = result.stdout
-            
-            # Compare key fields (not byte-for-byte as formatting may differ)
-            simple_fields = parse_fix_fields(simple_encoded)
-            mojo_fields = parse_fix_fields(mojo_encoded)
-            
-            # Check critical fields match
-            critical_tags = ['8', '35'] + [tag for tag, _ in fields]
-            all_match = True
-            
-            for tag in critical_tags:
-                if simple_fields.get(tag) != mojo_fields.get(tag):
-                    print(f"  ❌ FAIL: Tag {tag} mismatch")
-                    print(f"    simplefix: {simple_fields.get(tag)}")
-                    print(f"    mojofix:   {mojo_fields.get(tag)}")
-                    all_match = False
-            
-            if all_match:
-                print(f"  ✅ PASS: All fields match")
-                passed += 1
-            else:
-                failed += 1
-                
-        finally:
-            os.unlink(mojo_file)
+        mojo_fields = parse_fix_fields(mojo_cases[idx][0])
+        
+        # Check critical fields match
+        all_match = True
+        
+        for tag, expected in case["expected_fields"].items():
+            if expected != mojo_fields.get(tag):
+                print(f"  ❌ FAIL: Tag {tag} mismatch")
+                print(f"    simplefix: {expected}")
+                print(f"    mojofix:   {mojo_fields.get(tag)}")
+                all_match = False
+        
+        if all_match:
+            print(f"  ✅ PASS: All fields match")
+            passed += 1
+        else:
+            failed += 1
     
     print(f"\n{'=' * 70}")
     print(f"Encoding Tests: {passed} passed, {failed} failed")
@@ -116,50 +193,17 @@ def test_parsing_compatibility():
     print("CROSS-VALIDATION: Parsing Compatibility")
     print("=" * 70)
     
-    # Create test messages with simplefix
-    test_messages = []
-    
-    # Test 1: Simple heartbeat
-    msg1 = simplefix.FixMessage()
-    msg1.append_pair(8, "FIX.4.2")
-    msg1.append_pair(35, "0")
-    test_messages.append(("Heartbeat", msg1.encode().decode('utf-8')))
-    
-    # Test 2: New Order
-    msg2 = simplefix.FixMessage()
-    msg2.append_pair(8, "FIX.4.4")
-    msg2.append_pair(35, "D")
-    msg2.append_pair(55, "MSFT")
-    msg2.append_pair(54, "1")
-    msg2.append_pair(38, "200")
-    test_messages.append(("New Order", msg2.encode().decode('utf-8')))
+    test_messages = load_golden_vectors()["parsing"]
     
-    # Test 3: Logon
-    msg3 = simplefix.FixMessage()
-    msg3.append_pair(8, "FIX.4.2")
-    msg3.append_pair(35, "A")
-    msg3.append_pair(98, "0")
-    msg3.append_pair(108, "30")
-    test_messages.append(("Logon", msg3.encode().decode('utf-8')))
-    
-    passed = 0
-    failed = 0
-    
-    for test_name, fix_message in test_messages:
-        print(f"\nTest: {test_name}")
-        
-        # Parse with simplefix
-        simple_parser = simplefix.FixParser()
-        simple_parser.append_buffer(fix_message.encode('utf-8'))
-        simple_parsed = simple_parser.get_message()
-        
-        # Parse with mojofix
-        mojo_code = f'''
+    # Parse every message with mojofix in one driver run
+    mojo_code = '''
 from mojofix.parser import FixParser
-
-fn main() raises:
+'''
+    for idx, case in enumerate(test_messages):
+        mojo_code += f'''
+fn case_{idx}() raises:
     var parser = FixParser()
-    parser.append_buffer("{fix_message}")
+    parser.append_buffer("{case["message"]}")
     var msg_opt = parser.get_message()
     
     if msg_opt:
@@ -168,55 +212,56 @@ fn main() raises:
         var v8 = msg[8]
         var v35 = msg[35]
         if v8:
-            print("8=" + v8.value())
+            print("CASE {idx} 8=" + v8.value())
         if v35:
-            print("35=" + v35.value())
+            print("CASE {idx} 35=" + v35.value())
+'''
+    
+    mojo_code += '''
+fn main() raises:
 '''
+    for idx in range(len(test_messages)):
+        mojo_code += f'    case_{idx}()\n'
+    
+    result = run_mojo(mojo_code)
+    if result.returncode != 0:
+        print(f"  ❌ FAIL: Mojo execution failed")
+    mojo_cases = split_cases(result.stdout)
+    
+    passed = 0
+    failed = 0
+    
+    for idx, case in enumerate(test_messages):
+        print(f"\nTest: {case['name']}")
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.mojo', delete=False) as f:
-            f.write(mojo_code)
-            mojo_file = f.name
+        if idx not in mojo_cases:
+            print(f"  ❌ FAIL: No output from Mojo driver")
+            failed += 1
+            continue
         
-        try:
-            result = subprocess.run(
-                ['pixi', 'run', 'mojo', 'run', '-I', 'src', mojo_file],
-                capture_output=True,
-                text=True,
-                cwd=os.path.dirname(os.path.abspath(__file__)) + '/..'
-            )
-            
-            if result.returncode != 0:
-                print(f"  ❌ FAIL: Mojo execution failed")
-                failed += 1
-                continue
-            
-            # Compare outputs
-            simple_begin = simple_parsed.get(8).decode('utf-8') if simple_parsed.get(8) else None
-            simple_type = simple_parsed.get(35).decode('utf-8') if simple_parsed.get(35) else None
-            
-            mojo_output = result.stdout.strip().split('\n')
-            mojo_begin = None
-            mojo_type = None
-            
-            for line in mojo_output:
-                if line.startswith('8='):
-                    mojo_begin = line[2:]
-                elif line.startswith('35='):
-                    mojo_type = line[3:]
-            
-            if simple_begin == mojo_begin and simple_type == mojo_type:
-                print(f"  ✅ PASS: Parsing matches")
-                print(f"    BeginString: {simple_begin}")
-                print(f"    MsgType: {simple_type}")
-                passed += 1
-            else:
-                print(f"  ❌ FAIL: Parsing mismatch")
-                print(f"    simplefix: BeginString={simple_begin}, MsgType={simple_type}")
-                print(f"    mojofix:   BeginString={mojo_begin}, MsgType={mojo_type}")
-                failed += 1
-                
-        finally:
-            os.unlink(mojo_file)
+        # Compare outputs
+        simple_begin = case["expected_fields"]["8"]
+        simple_type = case["expected_fields"]["35"]
+        
+        mojo_begin = None
+        mojo_type = None
+        
+        for line in mojo_cases[idx]:
+            if line.startswith('8='):
+                mojo_begin = line[2:]
+            elif line.startswith('35='):
+                mojo_type = line[3:]
+        
+        if simple_begin == mojo_begin and simple_type == mojo_type:
+            print(f"  ✅ PASS: Parsing matches")
+            print(f"    BeginString: {simple_begin}")
+            print(f"    MsgType: {simple_type}")
+            passed += 1
+        else:
+            print(f"  ❌ FAIL: Parsing mismatch")
+            print(f"    simplefix: BeginString={simple_begin}, MsgType={simple_type}")
+            print(f"    mojofix:   BeginString={mojo_begin}, MsgType={mojo_type}")
+            failed += 1
     
     print(f"\n{'=' * 70}")
     print(f"Parsing Tests: {passed} passed, {failed} failed")
@@ -225,16 +270,13 @@ fn main() raises:
 
 def parse_fix_fields(fix_message):
     """Parse FIX message into dict of tag->value."""
-    fields = {}
-    pairs = fix_message.split('\x01')
-    for pair in pairs:
-        if '=' in pair:
-            tag, value = pair.split('=', 1)
-            fields[tag] = value
-    return fields
+    return dict(pair.split('=', 1) for pair in fix_message.split('\x01') if '=' in pair)
 
 
 def main():
+    if '--regenerate' in sys.argv[1:]:
+        return generate_golden_vectors()
+    
     print("\n" + "=" * 70)
     print("MOJOFIX vs SIMPLEFIX CROSS-VALIDATION TEST SUITE")
     print("=" * 70)
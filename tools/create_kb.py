@@ -1,5 +1,5 @@
 import os
-import xml.sax.saxutils
+from concurrent.futures import ProcessPoolExecutor
 
 # CONFIGURATION
 # Using the path to the standard library in the user's workspace
@@ -13,62 +13,95 @@ IGNORE_DIRS = {
 
 # Extensions to include
 INCLUDE_EXTS = {".mojo", ".d.mojo"}
+# str.endswith() takes a tuple and checks all suffixes in one call
+INCLUDE_EXTS_TUPLE = tuple(INCLUDE_EXTS)
+
+# Same characters xml.sax.saxutils.escape() handles, in one C-level pass
+_XML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# Files are read and escaped in chunks of this many characters
+CHUNK_SIZE = 64 * 1024
+# Output buffer size, so small per-file writes don't each hit the disk
+OUTPUT_BUFFER_SIZE = 1 << 20
 
 def is_ignored(path):
     parts = path.split(os.sep)
     return any(p in IGNORE_DIRS for p in parts)
 
+def collect_files():
+    """Walk REPO_PATH and return (full_path, rel_path, category) for every file to pack."""
+    entries = []
+    for root, dirs, files in os.walk(REPO_PATH):
+        # Modify dirs in-place to skip ignored folders
+        dirs[:] = [d for d in dirs if d not in IGNORE_DIRS]
+        
+        for file in files:
+            if not file.endswith(INCLUDE_EXTS_TUPLE):
+                continue
+            
+            full_path = os.path.join(root, file)
+            # Create a clean relative path (e.g., "collections/list.mojo")
+            rel_path = os.path.relpath(full_path, REPO_PATH)
+
+            # Check if this is a test file to categorize it (redundant if ignore "test" above, but good for safety)
+            is_test = "test" in rel_path.split(os.sep)
+            category = "usage_example" if is_test else "source_code"
+            entries.append((full_path, rel_path, category))
+    return entries
+
+def _escape_file(entry):
+    """Read and XML-escape one file; runs in a worker process.
+
+    Returns (rel_path, category, escaped_bytes, error). On failure
+    escaped_bytes is None and error describes why the file was skipped.
+    """
+    full_path, rel_path, category = entry
+    try:
+        parts = []
+        with open(full_path, "r", encoding="utf-8") as f:
+            while True:
+                chunk = f.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                # Escape content for XML safety
+                parts.append(chunk.translate(_XML_ESCAPE_TABLE).encode("utf-8"))
+        return rel_path, category, b"".join(parts), None
+    except Exception as e:
+        return rel_path, category, None, str(e)
+
 def create_knowledge_base():
     # Use absolute path for output to ensure it ends up in the project root or intended location
     # Here we write to current working directory, which should be the repo root when running
     output_path = os.path.abspath(OUTPUT_FILE)
     
     print(f"Scanning {REPO_PATH}...")
+    entries = collect_files()
     print(f"Writing to {output_path}...")
     
     try:
-        with open(output_path, "w", encoding="utf-8") as out:
-            out.write("<mojo_stdlib_context>\n")
-            out.write("  <description>Official Mojo Standard Library Source Code (Nightly)</description>\n\n")
+        with open(output_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as out:
+            out.write(b"<mojo_stdlib_context>\n")
+            out.write(b"  <description>Official Mojo Standard Library Source Code (Nightly)</description>\n\n")
 
             file_count = 0
             
-            for root, dirs, files in os.walk(REPO_PATH):
-                # Modify dirs in-place to skip ignored folders
-                dirs[:] = [d for d in dirs if d not in IGNORE_DIRS]
-                
-                for file in files:
-                    if not any(file.endswith(ext) for ext in INCLUDE_EXTS):
+            # Files are read and escaped in parallel; map() yields results in
+            # walk order so the output is the same as a sequential run
+            with ProcessPoolExecutor() as pool:
+                results = pool.map(_escape_file, entries, chunksize=32)
+                for rel_path, category, safe_content, error in results:
+                    if error is not None:
+                        print(f"Skipping {rel_path}: {error}")
                         continue
                     
-                    full_path = os.path.join(root, file)
-                    # Create a clean relative path (e.g., "collections/list.mojo")
-                    rel_path = os.path.relpath(full_path, REPO_PATH)
-                    
-                    # Double check ignore dirs in relative path components to be safe
-                    if any(part in IGNORE_DIRS for part in rel_path.split(os.sep)):
-                        continue
-                        
-                    # Check if this is a test file to categorize it (redundant if ignore "test" above, but good for safety)
-                    is_test = "test" in rel_path.split(os.sep)
-                    category = "usage_example" if is_test else "source_code"
-
-                    try:
-                        with open(full_path, "r", encoding="utf-8") as f:
-                            content = f.read()
-                            
-                        # Escape content for XML safety
-                        safe_content = xml.sax.saxutils.escape(content)
-                        
-                        out.write(f'  <file path="{rel_path}" category="{category}">\n')
-                        out.write(f'{safe_content}\n')
-                        out.write("  </file>\n")
-                        file_count += 1
-                        
-                    except Exception as e:
-                        print(f"Skipping {rel_path}: {e}")
+                    out.writelines((
+                        f'  <file path="{rel_path}" category="{category}">\n'.encode("utf-8"),
+                        safe_content,
+                        b"\n  </file>\n",
+                    ))
+                    file_count += 1
 
-            out.write("</mojo_stdlib_context>\n")
+            out.write(b"</mojo_stdlib_context>\n")
             print(f"Success! Packed {file_count} files into {output_path}")
             
     except IOError as e:
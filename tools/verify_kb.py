@@ -1,3 +1,4 @@
+import mmap
 import os
 import re
 
@@ -8,36 +9,38 @@ IGNORE_DIRS = {
     "scripts", "lit", "__pycache__", "build", ".git", ".github", "benchmarks", "test"
 }
 INCLUDE_EXTS = {".mojo", ".d.mojo"}
+INCLUDE_EXTS_TUPLE = tuple(INCLUDE_EXTS)
+
+# Simple regex to extract paths from <file path="...">
+FILE_PATH_RE = re.compile(rb'<file path="([^"]+)"')
 
 def get_repo_files():
     files_set = set()
     for root, dirs, files in os.walk(REPO_PATH):
         dirs[:] = [d for d in dirs if d not in IGNORE_DIRS]
         for file in files:
-            if not any(file.endswith(ext) for ext in INCLUDE_EXTS):
+            if not file.endswith(INCLUDE_EXTS_TUPLE):
                 continue
             
             full_path = os.path.join(root, file)
             rel_path = os.path.relpath(full_path, REPO_PATH)
-            
-            # Re-apply ignore check on path components just to be identical to generation logic
-            if any(part in IGNORE_DIRS for part in rel_path.split(os.sep)):
-                continue
-                
+
             files_set.add(rel_path)
     return files_set
 
 def get_xml_files():
     files_set = set()
     try:
-        with open(XML_FILE, 'r') as f:
-            content = f.read()
-            # Simple regex to extract paths from <file path="...">
-            matches = re.finditer(r'<file path="([^"]+)"', content)
-            for match in matches:
-                files_set.add(match.group(1))
+        with open(XML_FILE, 'rb') as f:
+            # Scan the mapped file directly instead of reading it into memory
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for match in FILE_PATH_RE.finditer(mm):
+                    files_set.add(match.group(1).decode('utf-8'))
     except FileNotFoundError:
         print(f"XML file not found: {XML_FILE}")
+    except ValueError:
+        # mmap cannot map an empty file
+        print(f"XML file is empty: {XML_FILE}")
     return files_set
 
 def verify():